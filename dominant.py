@@ -0,0 +1,127 @@
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# Dominant colour per panel: a small k-means over a fixed grid of samples, vectorised
+# over all panels and warm-started from the previous frame's centroids.
+
+
+class DominantColorReducer:
+    def __init__(self, panel_map, viewport_size, k=3, grid=16, iterations=1, warmup_iterations=8):
+        """
+        Parameters:
+            panel_map (list): Mapped panels from map_layout_no_overlap().
+            viewport_size (tuple): (width, height) of the sampled frames.
+            k (int): Clusters per panel.
+            grid (int): Samples per panel side (grid x grid pixels per panel).
+            iterations (int): k-means iterations per frame once warm.
+            warmup_iterations (int): k-means iterations on the first frame.
+        """
+        w, h = viewport_size
+        sample_idx = []
+        for p in panel_map:
+            x1, y1, x2, y2 = p['bbox']
+            xs = np.linspace(max(x1, 0), min(x2, w) - 1, grid).round().astype(np.int64)
+            ys = np.linspace(max(y1, 0), min(y2, h) - 1, grid).round().astype(np.int64)
+            sample_idx.append((ys[:, None] * w + xs[None, :]).ravel())
+        self._sample_idx = np.array(sample_idx)  # (panels, samples) into the flat frame
+        self.viewport_size = viewport_size
+        self.k = k
+        self.iterations = iterations
+        self.warmup_iterations = warmup_iterations
+        self._centroids = None  # (panels, k, 3) BGR, float32
+        self._last = None       # (centroids, shares) of the panels of the last reduce()
+
+    def _samples(self, frame, panels):
+        return frame.reshape(-1, 3)[self._sample_idx[panels]].astype(np.float32)
+
+    def reduce(self, frame, panels=None):
+        """
+        Return the dominant colour of each panel as a (panels, 3) uint8 RGB array, in
+        panel_map order, or for the `panels` indices only when given.
+        """
+        w, h = self.viewport_size
+        if frame.shape[:2] != (h, w):
+            frame = cv2.resize(frame, (w, h))  # sample indices assume the viewport size
+
+        panels = slice(None) if panels is None else np.asarray(panels)
+        iterations = self.iterations
+        if self._centroids is None:
+            # Seed with samples spread over each panel, then converge from scratch
+            samples = self._samples(frame, slice(None))
+            seeds = np.linspace(0, samples.shape[1] - 1, self.k).round().astype(np.int64)
+            self._centroids = samples[:, seeds].copy()
+            iterations = self.warmup_iterations
+
+        pixels = self._samples(frame, panels)  # (P, S, 3)
+        centroids = self._centroids[panels]    # (P, K, 3)
+        for _ in range(iterations):
+            dist = ((pixels[:, :, None, :] - centroids[:, None, :, :]) ** 2).sum(axis=-1)  # (P, S, K)
+            onehot = (dist.argmin(axis=-1)[..., None] == np.arange(self.k)).astype(np.float32)
+            counts = onehot.sum(axis=1)  # (P, K)
+            sums = np.einsum('psk,psc->pkc', onehot, pixels)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(counts[..., None] > 0, sums / np.maximum(counts, 1)[..., None], centroids)
+        self._centroids[panels] = centroids
+        self._last = (centroids, counts / pixels.shape[1])
+
+        dominant = centroids[np.arange(len(centroids)), counts.argmax(axis=1)]
+        return dominant[:, ::-1].round().astype(np.uint8)  # BGR to RGB
+
+    def clusters(self):
+        """
+        Every cluster of the panels of the last reduce() call: (panels, k, 3) uint8 RGB
+        centroids and the (panels, k) fraction of the panel each one covers.
+        """
+        centroids, shares = self._last
+        return centroids[..., ::-1].round().astype(np.uint8), shares
+
+
+def mean_colors(frame, panel_map):
+    """Plain mean of each panel region, RGB, to compare the reducer against."""
+    return np.array([frame[y1:y2, x1:x2].mean(axis=(0, 1))[::-1]
+                     for x1, y1, x2, y2 in (p['bbox'] for p in panel_map)]).astype(np.uint8)
+
+
+if __name__ == "__main__":
+    # python dominant.py [clip]: per-frame time of the mean and dominant reducers, and how
+    # saturated their colours are, on a recorded clip or a synthetic moving scene
+    from utils import demo_panel_map
+
+    size = (640, 480)
+    panel_map = demo_panel_map(size)
+
+    if len(sys.argv) == 2:
+        cap = cv2.VideoCapture(sys.argv[1])
+        frames = []
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(cv2.resize(frame, size))
+        cap.release()
+    else:
+        # Grey room with noise, a saturated object moving across it
+        rng = np.random.default_rng(0)
+        frames = []
+        for i in range(300):
+            frame = np.clip(120 + rng.normal(0, 8, (size[1], size[0], 3)), 0, 255).astype(np.uint8)
+            cv2.circle(frame, ((i * 5) % size[0], size[1] // 2), 80, (40, 40, 220), -1)
+            frames.append(frame)
+
+    def saturation(rgbs):
+        hsv = cv2.cvtColor(rgbs[None, :, ::-1].copy(), cv2.COLOR_BGR2HSV)
+        return hsv[0, :, 1].mean()
+
+    reducer = DominantColorReducer(panel_map, size)
+    for name, fn in [("mean", lambda f: mean_colors(f, panel_map)), ("dominant", reducer.reduce)]:
+        fn(frames[0])  # warm-up
+        sat = 0.0
+        t0 = time.perf_counter()
+        for frame in frames:
+            sat += saturation(fn(frame))
+        elapsed = (time.perf_counter() - t0) / len(frames)
+        print(f"{name:>8}: {elapsed * 1000:6.3f} ms/frame ({1 / elapsed:7.0f} FPS budget), "
+              f"mean panel saturation {sat / len(frames):5.1f}")
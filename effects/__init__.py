@@ -0,0 +1,45 @@
+"""
+Registry of the effects runnable through `nanoleaf-exp <effect>`.
+
+Nothing heavy is imported here: an entry only names the module implementing the
+effect and the third-party modules it needs, so listing effects is instant and
+running one only pays for the imports that effect actually uses.
+Each effect module exposes `main(argv)`, argv being the remaining CLI arguments.
+"""
+import importlib
+from collections import namedtuple
+
+# `optional` modules are only imported in some configurations (see the effect's .env keys)
+Effect = namedtuple("Effect", ["name", "module", "description", "requires", "optional"], defaults=[()])
+
+EFFECTS = {e.name: e for e in [
+    Effect("camera-bus", "framebus",
+           "Capture daemon sharing the webcam with camera effects (FRAME_BUS)",
+           ("numpy", "cv2")),
+    Effect("gif", "effects.gif",
+           "Play an animated GIF from assets/ (optional arg: file name)",
+           ("numpy", "cv2", "PIL")),
+    Effect("keyboard", "effects.keyboard",
+           "Show typed letters and digits on a 3x5 grid of panels",
+           ("pynput",)),
+    Effect("midi", "effects.midi",
+           "Flash a panel for every note played on a MIDI keyboard",
+           ("mido",)),
+    Effect("mood-mirror", "effects.mood_mirror",
+           "Mirror the webcam image onto the panels",
+           ("numpy", "cv2")),
+    Effect("procedural-ripple", "effects.procedural_ripple",
+           "Colour-cycling ripple waves from a fixed origin panel",
+           (), ("mido",)),  # mido with MIDI_CLOCK_PORT set, tap tempo otherwise
+    Effect("theremin", "effects.theremin",
+           "Play notes when a hand covers the note panels on the webcam",
+           ("numpy", "cv2", "scipy.signal", "sounddevice")),
+]}
+
+# Shared by every effect through utils.get_nanoleaf_object()
+COMMON_REQUIRES = ("dotenv", "zeroconf", "nanoleafapi")
+
+
+def load_effect(name):
+    """Import and return the module implementing the named effect."""
+    return importlib.import_module(EFFECTS[name].module)
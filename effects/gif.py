@@ -0,0 +1,99 @@
+import os
+import struct
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image, ImageSequence
+
+from dominant import DominantColorReducer
+from link import LinkController, udp_socket
+from preview import Preview
+from utils import get_nanoleaf_object, load_env, map_layout_no_overlap
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+DEFAULT_GIF = "rainbow.gif"
+
+# Final display size (rescaled GIF size)
+viewport_width = 640
+viewport_height = 480
+
+
+def load_gif_frames(gif_path):
+    gif = Image.open(gif_path)
+    frames = []
+    durations = []
+
+    for frame in ImageSequence.Iterator(gif):
+        rgb_frame = frame.convert("RGB")
+        np_frame = np.array(rgb_frame)
+        # The red/blue channel flip is due to OpenCV using BGR, while PIL and Nanoleaf expect RGB
+        resized = cv2.cvtColor(cv2.resize(np_frame, (viewport_width, viewport_height)), cv2.COLOR_BGR2RGB)
+        flipped = cv2.flip(resized, 1)
+        frames.append(flipped)
+        durations.append(frame.info.get("duration", 100))  # Duration in ms
+
+    return frames, durations
+
+
+def main(argv):
+    """Play an animated GIF from assets/ (default rainbow.gif) on the panels."""
+    load_env()
+    NL_IP = os.getenv("NANOLEAF_IP")
+    NL_UDP_PORT = int(os.getenv("NANOLEAF_UDP_PORT", 60222))
+
+    gif_path = ASSETS_DIR / (argv[0] if argv else DEFAULT_GIF)
+
+    # Init Nanoleaf object and UDP mode
+    nl = get_nanoleaf_object()
+    layout = [p for p in nl.get_layout()['positionData'] if p['panelId'] != 0]
+    nl.enable_extcontrol()
+    sock = udp_socket()
+
+    panel_map = map_layout_no_overlap(layout, viewport_size=(viewport_width, viewport_height), stretch=False)
+    print(f"🟩 Panel map: {len(panel_map)} panels mapped.")
+    reducer = DominantColorReducer(panel_map, (viewport_width, viewport_height))
+
+    preview = Preview.from_env(panel_map, (viewport_width, viewport_height), title="GIF Mood Preview").start()
+
+    def send_colors_to_panels(sock, rgbs, transition):
+        payload = struct.pack('>H', len(panel_map))
+        for p in panel_map:
+            r, g, b = rgbs[p['panelId']]
+            payload += struct.pack('>HBBBBH', p['panelId'], r, g, b, 0, transition)
+        link.send(sock, payload, (NL_IP, NL_UDP_PORT))
+
+    # --- Load GIF frames using PIL ---
+    frames, durations = load_gif_frames(gif_path)
+    print(f"🎞️ Loaded {len(frames)} GIF frames")
+
+    # The GIF sets the frame rate; the link can only slow it down (frames are held longer)
+    gif_fps = 1000 * len(durations) / sum(durations)
+    link = LinkController.from_env(nl, fps=gif_fps, transition=2, min_fps=min(5, gif_fps), max_fps=gif_fps)
+
+    # --- Loop through GIF frames ---
+    rgbs = {k['panelId']: None for k in panel_map}
+    print("🎥 Playing animated GIF to Nanoleaf. Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            for i, frame in enumerate(frames):
+                h, w, _ = frame.shape
+
+                # Dominant colour of every panel region in one go (RGB)
+                for p, rgb in zip(panel_map, reducer.reduce(frame).tolist()):
+                    rgbs[p['panelId']] = tuple(rgb)
+
+                send_colors_to_panels(sock, rgbs, link.transition)
+                preview.submit(frame, dict(rgbs))
+
+                if preview.poll() & 0xFF == ord('q'):
+                    raise KeyboardInterrupt
+                link.pace(max(durations[i] / 1000.0, link.interval))
+
+    except KeyboardInterrupt:
+        print("\n🛑 Playback stopped by user.")
+
+    finally:
+        link.stop()
+        preview.stop()
@@ -1,19 +1,11 @@
 import os
 import socket
 import struct
-from pathlib import Path
 from random import randint
 
-from dotenv import load_dotenv
 from pynput import keyboard
 
-from utils import get_nanoleaf_object
-
-# Load environment variables
-load_dotenv(Path(__file__).resolve().parent / ".env")
-NL_IP = os.getenv("NANOLEAF_IP")
-NL_TOKEN = os.getenv("NANOLEAF_TOKEN")
-NL_UDP_PORT = int(os.getenv("NANOLEAF_UDP_PORT", 60222))
+from utils import get_nanoleaf_object, load_env
 
 # Corrected 3 columns x 5 rows grid mapping
 grid_to_panel = {
@@ -24,27 +16,6 @@ grid_to_panel = {
     (0,4): 56570, (1,4): 22098, (2,4): 8025,
 }
 
-# Track active key
-active_keys = set()
-
-# Init Nanoleaf object and UDP mode
-nl = get_nanoleaf_object()
-all_panel_ids = [p['panelId'] for p in nl.get_layout()['positionData']]
-panel_map = [p for p in nl.get_layout()['positionData'] if p['panelId'] in grid_to_panel.values()]
-#print(layout)
-nl.enable_extcontrol()
-sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-
-def send_colors_to_panels(sock, panel_ids, color, transition=2):
-    payload = struct.pack('>H', len(panel_ids))
-    r, g, b = color
-
-    for p in panel_ids:
-        payload += struct.pack('>HBBBBH', p, r, g, b, 0, transition)
-
-    sock.sendto(payload, (NL_IP, NL_UDP_PORT))
-
-
 # Letter definitions in 3-wide × 5-high grid
 letter_map = {
     # Letters A–Z
@@ -91,31 +62,55 @@ letter_map = {
 }
 
 
-def on_press(key):
-    
-    try:
-        k = key.char.upper()
-        if k in letter_map and k not in active_keys:
-            active_keys.add(k)
-            # resetting the panels briefly to avoid blended letters when typing fast
-            send_colors_to_panels(sock, all_panel_ids, [0,0,0], transition=0)
-            panel_ids = [grid_to_panel[pos] for pos in letter_map[k]]
-            send_colors_to_panels(sock, panel_ids, [randint(40, 255),randint(40, 255),randint(40, 255)], transition=1)
-    except AttributeError:
-        pass  # special keys (ctrl, etc)
-
-def on_release(key):
-    try:
-        k = key.char.upper()
-        if k in letter_map and k in active_keys:
-            active_keys.remove(k)
-            panel_ids = [grid_to_panel[pos] for pos in letter_map[k]]
-            send_colors_to_panels(sock, panel_ids, [0,0,0], transition=16)
-    except AttributeError:
-        pass
-
-
-print("Listening for keys a-z and 0-9 on 3×5 grid...")
-with keyboard.Listener(on_press=on_press, on_release=on_release) as listener:
-    listener.join()
+def send_colors_to_panels(sock, target, panel_ids, color, transition=2):
+    payload = struct.pack('>H', len(panel_ids))
+    r, g, b = color
+
+    for p in panel_ids:
+        payload += struct.pack('>HBBBBH', p, r, g, b, 0, transition)
 
+    sock.sendto(payload, target)
+
+
+def main(argv):
+    """Light up letters and digits typed on the keyboard on a 3x5 grid of panels."""
+    load_env()
+    NL_IP = os.getenv("NANOLEAF_IP")
+    NL_UDP_PORT = int(os.getenv("NANOLEAF_UDP_PORT", 60222))
+    target = (NL_IP, NL_UDP_PORT)
+
+    # Track active key
+    active_keys = set()
+
+    # Init Nanoleaf object and UDP mode
+    nl = get_nanoleaf_object()
+    all_panel_ids = [p['panelId'] for p in nl.get_layout()['positionData']]
+    nl.enable_extcontrol()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def on_press(key):
+
+        try:
+            k = key.char.upper()
+            if k in letter_map and k not in active_keys:
+                active_keys.add(k)
+                # resetting the panels briefly to avoid blended letters when typing fast
+                send_colors_to_panels(sock, target, all_panel_ids, [0,0,0], transition=0)
+                panel_ids = [grid_to_panel[pos] for pos in letter_map[k]]
+                send_colors_to_panels(sock, target, panel_ids, [randint(40, 255),randint(40, 255),randint(40, 255)], transition=1)
+        except AttributeError:
+            pass  # special keys (ctrl, etc)
+
+    def on_release(key):
+        try:
+            k = key.char.upper()
+            if k in letter_map and k in active_keys:
+                active_keys.remove(k)
+                panel_ids = [grid_to_panel[pos] for pos in letter_map[k]]
+                send_colors_to_panels(sock, target, panel_ids, [0,0,0], transition=16)
+        except AttributeError:
+            pass
+
+    print("Listening for keys a-z and 0-9 on 3×5 grid...")
+    with keyboard.Listener(on_press=on_press, on_release=on_release) as listener:
+        listener.join()
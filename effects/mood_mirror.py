@@ -0,0 +1,96 @@
+import os
+import struct
+
+from dominant import DominantColorReducer
+from framebus import open_capture
+from link import LinkController, udp_socket
+from motion import MotionGate
+from preview import Preview
+from utils import get_nanoleaf_object, load_env, map_layout_no_overlap
+
+# Assume your final viewport is width × height
+# Is performance much impacted by viewport size? => display FPS to understand that
+viewport_width = 640
+viewport_height = 480
+
+
+def main(argv):
+    """Mirror the webcam image onto the panels, one colour per panel."""
+    load_env()
+    NL_IP = os.getenv("NANOLEAF_IP")
+    CAMERA_INDEX = int(os.getenv("CAMERA_INDEX", 1))
+    FRAME_BUS = os.getenv("FRAME_BUS")
+    NL_UDP_PORT = int(os.getenv("NANOLEAF_UDP_PORT", 60222))
+
+    # Init Nanoleaf object and UDP mode
+    nl = get_nanoleaf_object()
+    layout = [p for p in nl.get_layout()['positionData'] if p['panelId'] != 0]
+    #print(layout)
+    nl.enable_extcontrol()
+    sock = udp_socket()
+
+    # Send rate and transition adapt to how well the panels keep up
+    link = LinkController.from_env(nl, fps=30, transition=2)
+
+    # Map each panel to normalized screen space
+    # stretching so as to maximise the useful area of the viewport
+    panel_map = map_layout_no_overlap(layout, viewport_size=(viewport_width, viewport_height), stretch=False)
+    print(panel_map)
+    # Each panel shows the colour covering most of it rather than a washed-out mean
+    reducer = DominantColorReducer(panel_map, (viewport_width, viewport_height))
+
+    preview = Preview.from_env(panel_map, (viewport_width, viewport_height), title="Mood Mirror Preview").start()
+
+    # UDP is bloody fast
+    # 0 transition to too choppy, 5 transition is too laggy at 30 FPS
+    def send_colors_to_panels(sock, rgbs, transition):
+        payload = struct.pack('>H', len(panel_map))
+
+        for p in panel_map:
+            r, g, b = rgbs[p['panelId']]
+            payload += struct.pack('>HBBBBH', p['panelId'], r, g, b, 0, transition)
+
+        link.send(sock, payload, (NL_IP, NL_UDP_PORT))
+
+    # Open the USB camera, or share the capture daemon's frames when FRAME_BUS is set
+    cap = open_capture(CAMERA_INDEX, (viewport_width, viewport_height), FRAME_BUS)
+
+    # Only panels whose region changed get resampled; a static room idles at a low rate
+    gate = MotionGate(panel_map, (viewport_width, viewport_height))
+
+    print("🎥 Mood Mirror (Digital Twin) running... Press Ctrl+C to stop.")
+
+    try:
+        rgbs = {k['panelId']: None for k in panel_map}
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                print("❌ Could not read frame from webcam")
+                break
+
+            #frame = cv2.flip(frame, 1)  # Flip if needed
+            h, w, _ = frame.shape
+
+            # Set colors to the panels whose region changed
+            changed = gate.update(frame)
+            if len(changed):
+                for i, rgb in zip(changed, reducer.reduce(frame, changed).tolist()):
+                    #rgb = apply_gamma(rgb)
+                    #rgb = boost_saturation(*rgb, factor=1.5)
+                    rgbs[panel_map[i]['panelId']] = tuple(rgb)
+
+            if gate.should_send(changed):
+                send_colors_to_panels(sock, rgbs, link.transition)  # Push updates in one go (efficient)
+            preview.submit(frame, dict(rgbs))
+
+            if preview.poll() & 0xFF == ord('q'):
+                break
+            link.pace(gate.idle_interval if gate.idle else None)
+
+    except KeyboardInterrupt:
+        print("\n🛑 Mood Mirror stopped by user.")
+
+    finally:
+        link.stop()
+        preview.stop()
+        cap.release()
@@ -0,0 +1,141 @@
+import math
+import os
+import struct
+import sys
+import threading
+from collections import defaultdict, deque
+from colorsys import hsv_to_rgb
+
+from link import LinkController, udp_socket
+from tempo import BeatScheduler, TempoTracker
+from utils import get_nanoleaf_object, load_env
+
+ORIGIN_ID = 45933  # start ripple from here
+
+# Ripple params
+PERIOD = 3.0                # seconds per wave when free-running (no clock, no taps)
+BEATS_PER_WAVE = 1          # with a tempo, every wave starts on a beat
+WAVES_PER_COLOR = 2
+LEVEL_DELAY = 0.1 / PERIOD  # delay between ripple levels, in waves
+FPS = 30                    # starting rate, adapted by LinkController
+TRANSITION = 5              # transition at FPS, scaled with the adapted rate
+
+
+# Build adjacency graph based on proximity threshold
+def build_adjacency(panels, threshold=75):
+    graph = defaultdict(list)
+    for p1 in panels:
+        for p2 in panels:
+            if p1['panelId'] == p2['panelId']:
+                continue
+            dx = p1['x'] - p2['x']
+            dy = p1['y'] - p2['y']
+            dist = math.hypot(dx, dy)
+            if dist <= threshold:
+                graph[p1['panelId']].append(p2['panelId'])
+    return graph
+
+
+def compute_ripple_levels(graph, origin_id):
+    visited = {origin_id: 0}
+    queue = deque([origin_id])
+
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph[node]:
+            if neighbor not in visited:
+                visited[neighbor] = visited[node] + 1
+                queue.append(neighbor)
+    return visited  # panelId -> ripple level
+
+
+def main(argv):
+    """Send colour-cycling ripple waves across the panels from a fixed origin."""
+    load_env()
+    NL_IP = os.getenv("NANOLEAF_IP")
+    NL_UDP_PORT = int(os.getenv("NANOLEAF_UDP_PORT", 60222))
+    MIDI_CLOCK_PORT = os.getenv("MIDI_CLOCK_PORT")
+
+    # Init NanoleafDigitalTwin
+    nl = get_nanoleaf_object()
+    layout = nl.get_layout()
+    print(layout)
+    panels = [p for p in layout['positionData'] if p['panelId']
+    # not in (7824,25891,35132)
+    ]
+
+    # This starts the UDP extcontrol mode
+    nl.enable_extcontrol()
+
+    adj_graph = build_adjacency(panels)
+    print(adj_graph)
+
+    ripple_levels = compute_ripple_levels(adj_graph, ORIGIN_ID)
+    print(ripple_levels)
+
+    # Networking
+    sock = udp_socket()
+    link = LinkController.from_env(nl, fps=FPS, transition=TRANSITION)
+
+    # Re-init the 3 big squares
+    payload = struct.pack('>H', 3)
+    for p in [7824,25891,35132]:
+        payload += struct.pack('>HBBBBH', p, 0, 0, 0, 0, 0)
+    sock.sendto(payload, (NL_IP, NL_UDP_PORT))
+
+    # Waves follow the MIDI clock when MIDI_CLOCK_PORT is set, tap tempo otherwise
+    tracker = TempoTracker(bpm=60 / PERIOD * BEATS_PER_WAVE)
+    clock_input = None
+    if MIDI_CLOCK_PORT:
+        import mido
+        inputs = mido.get_input_names()
+        matches = [port for port in inputs if MIDI_CLOCK_PORT in port]
+        if not matches:
+            print(f"❌ No MIDI input matching MIDI_CLOCK_PORT={MIDI_CLOCK_PORT!r}, available: {inputs}")
+            link.stop()
+            return 1
+        # Keep the port referenced for the whole run: mido closes it when collected
+        clock_input = mido.open_input(matches[0], callback=tracker.on_message)
+        print(f"🥁 Following MIDI clock from {matches[0]}")
+    else:
+        def tap_tempo():
+            for _ in sys.stdin:
+                tracker.tap()
+                print(f"🥁 {tracker.bpm:.1f} BPM")
+
+        threading.Thread(target=tap_tempo, daemon=True).start()
+        print("🥁 Press Enter on the beat to tap the tempo")
+
+    def render(beat):
+        waves = beat / BEATS_PER_WAVE
+
+        # 🔁 Cycle color every N waves using HSV hue
+        wave_index = int(waves / WAVES_PER_COLOR)
+        hue = (wave_index * 0.2) % 1.0  # rotate hue [0.0, 1.0]
+        r_f, g_f, b_f = hsv_to_rgb(hue, 1.0, 1.0)
+        COLOR = (int(r_f * 255), int(g_f * 255), int(b_f * 255))
+
+        # Build UDP payload
+        transition = link.transition
+        payload = struct.pack('>H', len(panels))
+        for p in panels:
+            lvl = ripple_levels.get(p['panelId'], 99)
+            delay = lvl * LEVEL_DELAY
+            wave_phase = (waves - delay) % 1.0
+            intensity = (math.cos(2 * math.pi * wave_phase) + 1) / 2
+            r, g, b = [int(intensity * c) for c in COLOR]
+            payload += struct.pack('>HBBBBH', p['panelId'], r, g, b, 0, transition)
+        return payload
+
+    # Frames are rendered just ahead of their slot on the beat grid and sent on time
+    scheduler = BeatScheduler(tracker, render, lambda payload: link.send(sock, payload, (NL_IP, NL_UDP_PORT)),
+                              fps=lambda: link.fps)
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        mean, p99, worst = scheduler.jitter_stats()
+        print(f"\n🛑 Ripple stopped. On-beat send jitter: mean {mean:.2f} ms, p99 {p99:.2f} ms, max {worst:.2f} ms")
+    finally:
+        link.stop()
+        if clock_input is not None:
+            clock_input.close()
@@ -0,0 +1,179 @@
+import os
+import struct
+
+import cv2
+import numpy as np
+import sounddevice as sd
+from scipy.signal import sawtooth
+
+from dominant import DominantColorReducer
+from framebus import open_capture
+from link import LinkController, udp_socket
+from preview import Preview
+from utils import get_nanoleaf_object, load_env, map_layout_no_overlap
+
+# Assume your final viewport is width × height
+# Is performance much impacted by viewport size? => display FPS to understand that
+viewport_width = 640
+viewport_height = 480
+SAMPLE_RATE = 44100
+FRAME_SIZE = 1024
+HAND_SHARE = 0.2  # fraction of a note panel a skin-toned cluster must cover to play
+
+# Map panel IDs to note frequencies
+panel_note_map = {
+    56018: 261.63,  # C4
+    30027: 293.66,  # D4
+    56570: 329.63,  # E4
+}
+
+
+# Adjustable tone generator
+def generate_pleasant_wave(freq, t, phase):
+    # Single blended waveform: sine + triangle
+    waveform = (
+        0.5 * np.sin(2 * np.pi * freq * t + phase) +
+        0.3 * sawtooth(2 * np.pi * freq * t + phase, 0.5)
+    )
+    return waveform
+
+
+def is_skin_tone(r, g, b):
+    # OpenCV uses BGR → HSV
+    bgr = np.uint8([[[b, g, r]]])
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)[0][0]
+    h, s, v = hsv
+
+    return (
+        0 <= h <= 25 and
+        20 <= s <= 150 and
+        v >= 150
+    )
+
+
+def main(argv):
+    """Play a note while a skin-toned hand covers one of the note panels."""
+    load_env()
+    NL_IP = os.getenv("NANOLEAF_IP")
+    CAMERA_INDEX = int(os.getenv("CAMERA_INDEX", 1))
+    FRAME_BUS = os.getenv("FRAME_BUS")
+    NL_UDP_PORT = int(os.getenv("NANOLEAF_UDP_PORT", 60222))
+
+    # Init Nanoleaf object and UDP mode
+    nl = get_nanoleaf_object()
+    layout = [p for p in nl.get_layout()['positionData'] if p['panelId'] != 0]
+    #print(layout)
+    nl.enable_extcontrol()
+    sock = udp_socket()
+
+    # Send rate and transition adapt to how well the panels keep up
+    link = LinkController.from_env(nl, fps=30, transition=2)
+
+    # Map each panel to normalized screen space
+    # stretching so as to maximise the useful area of the viewport
+    panel_map = map_layout_no_overlap(layout, viewport_size=(viewport_width, viewport_height), stretch=False)
+    print(panel_map)
+    # Panels show their dominant colour; notes check every colour cluster, so a hand
+    # plays as soon as it covers HAND_SHARE of the panel, not only once it dominates
+    reducer = DominantColorReducer(panel_map, (viewport_width, viewport_height))
+
+    preview = Preview.from_env(panel_map, (viewport_width, viewport_height), title="Webcam theremin Preview", font_scale=0.40).start()
+
+    # Active state: panel_id -> bool
+    active_panels = {pid: False for pid in panel_note_map}
+
+    # Store tone settings and phase per panel
+    note_phases = {pid: 0.0 for pid in panel_note_map}
+    note_freqs = panel_note_map.copy()
+
+    def audio_callback(outdata, frames, time_info, status):
+        t = np.arange(frames) / SAMPLE_RATE
+        out = np.zeros(frames)
+
+        for pid, freq in note_freqs.items():
+            if active_panels.get(pid):
+                phase = note_phases[pid]
+                wave = generate_pleasant_wave(freq, t, phase)
+                out += wave
+                note_phases[pid] = (phase + 2 * np.pi * freq * frames / SAMPLE_RATE) % (2 * np.pi)
+
+        # Apply global soft fade-in/out on the entire output buffer if desired
+        out *= 0.3  # final volume
+        outdata[:] = out.reshape(-1, 1)
+
+    # Start audio stream in background
+    stream = sd.OutputStream(
+        channels=1,
+        callback=audio_callback,
+        samplerate=SAMPLE_RATE,
+        blocksize=FRAME_SIZE
+    )
+    stream.start()
+
+    # UDP is bloody fast
+    # 0 transition to too choppy, 5 transition is too laggy at 30 FPS
+    def send_colors_to_panels(sock, rgbs, transition):
+        payload = struct.pack('>H', len(panel_map))
+
+        for p in panel_map:
+            r, g, b = rgbs[p['panelId']]
+            payload += struct.pack('>HBBBBH', p['panelId'], r, g, b, 0, transition)
+
+        link.send(sock, payload, (NL_IP, NL_UDP_PORT))
+
+    # Open the USB camera, or share the capture daemon's frames when FRAME_BUS is set
+    cap = open_capture(CAMERA_INDEX, (viewport_width, viewport_height), FRAME_BUS)
+
+    print("🎥 Mood Mirror (Digital Twin) running... Press Ctrl+C to stop.")
+
+    try:
+        rgbs = {k['panelId']: None for k in panel_map}
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                print("❌ Could not read frame from webcam")
+                break
+
+            #frame = cv2.flip(frame, 1)  # Flip if needed
+            h, w, _ = frame.shape
+
+            # Set colors to panels, dominant colour of every panel region in one go
+            dominant = reducer.reduce(frame).tolist()
+            centroids, shares = reducer.clusters()
+            for i, (p, (r, g, b)) in enumerate(zip(panel_map, dominant)):
+                pid = p['panelId']
+                #r, g, b = apply_gamma((r, g, b))
+                #r, g, b = boost_saturation(r, g, b, factor=1.5)
+
+                # Check if this panel has a note assigned and is "pink"
+                if pid in panel_note_map:
+                    is_pink = any(is_skin_tone(*rgb) for rgb, share in zip(centroids[i].tolist(), shares[i])
+                                  if share >= HAND_SHARE)
+                    #is_pink= is_pinkish_block(block)
+                    if is_pink and not active_panels[pid]:
+                        print(f"▶️ Start tone for panel {pid}")
+                        active_panels[pid] = True
+                    elif not is_pink and active_panels[pid]:
+                        print(f"⏹️ Stop tone for panel {pid}")
+                        active_panels[pid] = False
+
+                rgbs[pid] = (r, g, b)
+
+            send_colors_to_panels(sock, rgbs, link.transition)  # Push updates in one go (efficient)
+            # Playing panels get a yellow dot in the preview
+            playing = {pid for pid, on in active_panels.items() if on}
+            preview.submit(frame, dict(rgbs), playing)
+
+            if preview.poll() & 0xFF == ord('q'):
+                break
+            link.pace()
+
+    except KeyboardInterrupt:
+        print("\n🛑 Mood Mirror stopped by user.")
+
+    finally:
+        link.stop()
+        preview.stop()
+        cap.release()
+        stream.stop()
+        stream.close()
@@ -0,0 +1,202 @@
+import os
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+# Shared memory ring buffer the capture daemon publishes camera frames to, so several
+# effects can read the same camera.
+
+# Header of int64 [magic, height, width, channels, slots, latest seq, writer pid, seq of
+# each slot (-1 while it is being written)], followed by the frames
+MAGIC = 0x4E4C4642  # "NLFB"
+DEFAULT_BUS = "nanoleaf-camera"
+_HEADER_FIELDS = 7
+_LATEST = 5
+_PID = 6
+
+
+def _pid_alive(pid):
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # alive, owned by another user
+    return True
+
+
+def _remove_stale(name):
+    """Unlink a frame bus left behind by a daemon that died without cleaning up."""
+    shm = shared_memory.SharedMemory(name=name)
+    magic = pid = None
+    if shm.size >= _HEADER_FIELDS * 8:
+        header = np.ndarray((_HEADER_FIELDS,), np.int64, shm.buf)
+        magic, pid = int(header[0]), int(header[_PID])
+        del header
+    if magic != MAGIC or _pid_alive(pid):
+        shm.close()
+        resource_tracker.unregister(shm._name, "shared_memory")  # not ours to unlink
+        if magic != MAGIC:
+            raise FileExistsError(f"Shared memory {name!r} exists and is not a frame bus, "
+                                  f"set another FRAME_BUS or remove /dev/shm/{name}")
+        raise FileExistsError(f"Frame bus {name!r} is already published by process {pid}")
+    print(f"🧹 Removing stale frame bus {name!r} left by process {pid}")
+    shm.close()
+    shm.unlink()
+
+
+def _attach(name):
+    """Attach to an existing segment without letting this process unlink it on exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class FrameBusWriter:
+    def __init__(self, shape, name=DEFAULT_BUS, slots=8):
+        h, w, c = shape
+        self.slots = slots
+        header_size = (_HEADER_FIELDS + slots) * 8
+        size = header_size + slots * h * w * c
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            _remove_stale(name)
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._header = np.ndarray((_HEADER_FIELDS + slots,), np.int64, self.shm.buf)
+        self._frames = np.ndarray((slots, h, w, c), np.uint8, self.shm.buf, offset=header_size)
+        self._header[:] = -1
+        self._header[:_LATEST] = (MAGIC, h, w, c, slots)
+        self._header[_PID] = os.getpid()
+        self.seq = -1
+
+    def publish(self, frame):
+        self.seq += 1
+        slot = self.seq % self.slots
+        self._header[_HEADER_FIELDS + slot] = -1  # being written
+        self._frames[slot] = frame
+        self._header[_HEADER_FIELDS + slot] = self.seq
+        self._header[_LATEST] = self.seq
+        return self.seq
+
+    def close(self):
+        del self._header, self._frames  # release the buffer exports before closing
+        self.shm.close()
+        self.shm.unlink()
+
+
+class FrameBusReader:
+    def __init__(self, name=DEFAULT_BUS):
+        try:
+            self.shm = _attach(name)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No frame bus {name!r}, start `nanoleaf-exp camera-bus` first") from None
+        header = np.ndarray((_HEADER_FIELDS,), np.int64, self.shm.buf)
+        magic, h, w, c, slots = header[:_LATEST]
+        if magic != MAGIC:
+            raise ValueError(f"Shared memory {name!r} is not a frame bus")
+        self.shape = (int(h), int(w), int(c))
+        self.slots = int(slots)
+        header_size = (_HEADER_FIELDS + self.slots) * 8
+        self._header = np.ndarray((_HEADER_FIELDS + self.slots,), np.int64, self.shm.buf)
+        self._frames = np.ndarray((self.slots,) + self.shape, np.uint8, self.shm.buf, offset=header_size)
+        self.last_seq = -1
+
+    def latest(self):
+        """Return (seq, frame view) of the latest complete frame, or (-1, None) if none yet."""
+        while True:
+            seq = int(self._header[_LATEST])
+            if seq < 0:
+                return -1, None
+            slot = seq % self.slots
+            frame = self._frames[slot]
+            if self._header[_HEADER_FIELDS + slot] == seq:
+                return seq, frame
+            # The writer lapped us while we looked the slot up, try the newer one
+
+    def still_valid(self, seq):
+        """True while the frame returned for `seq` hasn't been overwritten."""
+        return self._header[_HEADER_FIELDS + seq % self.slots] == seq
+
+    def read(self, timeout=2.0):
+        """
+        VideoCapture-like read(): wait for a frame newer than the last one read and
+        return a copy of it owned by the caller, safe to keep or hand to another thread.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            seq, frame = self.latest()
+            if seq > self.last_seq:
+                frame = frame.copy()
+                if self.still_valid(seq):
+                    self.last_seq = seq
+                    return True, frame
+                continue  # overwritten while copying, take the newer one
+            if time.monotonic() > deadline:
+                return False, None
+            time.sleep(0.001)
+
+    def release(self):
+        del self._header, self._frames
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # the caller still holds a frame view, the mapping goes away on exit
+
+
+def open_capture(camera_index, viewport_size, bus_name=None):
+    """
+    The camera for an effect: frames from the capture daemon when `bus_name` is set
+    (FRAME_BUS in .env), otherwise the USB camera opened directly as before.
+    """
+    if bus_name:
+        return FrameBusReader(bus_name)
+
+    import cv2
+    w, h = viewport_size
+    cap = cv2.VideoCapture(camera_index)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, w)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # don't wake up from idle on stale buffered frames
+    return cap
+
+
+def main(argv):
+    """Capture daemon: decode the USB camera once and publish frames on the frame bus."""
+    import cv2
+
+    from utils import load_env
+
+    load_env()
+    CAMERA_INDEX = int(os.getenv("CAMERA_INDEX", 1))
+    bus_name = os.getenv("FRAME_BUS") or DEFAULT_BUS
+
+    # Same viewport as the camera effects
+    viewport_width = 640
+    viewport_height = 480
+    cap = open_capture(CAMERA_INDEX, (viewport_width, viewport_height))
+    writer = FrameBusWriter((viewport_height, viewport_width, 3), name=bus_name)
+    print(f"📡 Publishing camera {CAMERA_INDEX} on frame bus '{bus_name}'. Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                print("❌ Could not read frame from webcam")
+                break
+            if frame.shape[:2] != (viewport_height, viewport_width):
+                frame = cv2.resize(frame, (viewport_width, viewport_height))
+            writer.publish(frame)
+
+    except KeyboardInterrupt:
+        print("\n🛑 Frame bus stopped by user.")
+
+    finally:
+        cap.release()
+        writer.close()
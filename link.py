@@ -0,0 +1,234 @@
+import os
+import random
+import socket
+import threading
+import time
+from math import ceil
+
+# Adaptive send rate (AIMD on send errors, simulator loss and an optional HTTP probe)
+# with the transition scaled to the frame interval.
+
+
+def udp_socket():
+    """Non-blocking UDP socket: a full send buffer raises (and counts) instead of stalling the loop."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    return sock
+
+
+class LinkController:
+    def __init__(self, fps=30, transition=2, min_fps=5, max_fps=60, max_transition=10,
+                 window=1.0, http_interval=None, http_slow=0.25):
+        """
+        Parameters:
+            fps (float): Starting send rate, also the rate `transition` was tuned for.
+            transition (int): Transition (x100 ms) that looks right at `fps`.
+            min_fps, max_fps (float): Bounds of the adaptive send rate.
+            max_transition (int): Upper bound of the adaptive transition.
+            window (float): Seconds of measurements per adjustment.
+            http_interval (float): Seconds between HTTP probes, None/0 to disable.
+            http_slow (float): HTTP round trip (s) above which the link is congested.
+        """
+        self.base_fps = fps
+        self.base_transition = transition
+        self.min_fps = min_fps
+        self.max_fps = max_fps
+        self.max_transition = max_transition
+        self.window = window
+        self.http_interval = http_interval
+        self.http_slow = http_slow
+
+        self.fps = float(fps)
+        self.sent = 0
+        self.errors = 0
+        self.http_latency = None
+        self.last_loss = 0.0
+        self.simulator = None
+
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._next_frame = self._window_start
+        self._sim_mark = (0, 0)
+        self._http_thread = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_env(cls, nl, **kwargs):
+        """Controller probing `nl` every NANOLEAF_HTTP_PROBE seconds when set in .env."""
+        link = cls(http_interval=float(os.getenv("NANOLEAF_HTTP_PROBE") or 0), **kwargs)
+        link.start_http_probe(nl)
+        return link
+
+    @property
+    def transition(self):
+        """Transition matching the current frame interval, as used at the base rate."""
+        t = ceil(self.base_transition * self.base_fps / self.fps)
+        return max(1, min(self.max_transition, t))
+
+    @property
+    def interval(self):
+        return 1 / self.fps
+
+    def send(self, sock, payload, target):
+        """sendto() that records errors and backpressure, then adapts the rate if due."""
+        try:
+            sock.sendto(payload, target)
+        except OSError:
+            # Buffer full (ENOBUFS/EAGAIN) or network down: the frame is lost
+            with self._lock:
+                self.errors += 1
+        with self._lock:
+            self.sent += 1
+        self.maybe_adjust()
+
+    def pace(self, interval=None):
+        """
+        Sleep until the next frame is due, `interval` (default the current rate's) after
+        the previous one, so the loop's own work counts towards the frame interval.
+        A loop running late starts over from now rather than bursting to catch up.
+        """
+        now = time.monotonic()
+        self._next_frame = max(self._next_frame + (self.interval if interval is None else interval), now)
+        time.sleep(self._next_frame - now)
+
+    def attach_simulator(self, simulator):
+        """Use the loss reported by a local LinkSimulator as a congestion signal."""
+        self.simulator = simulator
+        self._sim_mark = simulator.stats()
+
+    def start_http_probe(self, nl):
+        """Periodically time a cheap GET on the Nanoleaf API in a background thread."""
+        if not self.http_interval:
+            return
+
+        def probe():
+            while not self._stop.wait(self.http_interval):
+                t0 = time.perf_counter()
+                try:
+                    nl.get_power()
+                    latency = time.perf_counter() - t0
+                except Exception:
+                    latency = float("inf")
+                with self._lock:
+                    self.http_latency = latency
+
+        self._http_thread = threading.Thread(target=probe, daemon=True)
+        self._http_thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def maybe_adjust(self):
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return
+        self._window_start = now
+
+        with self._lock:
+            sent, errors = self.sent, self.errors
+            # A probe counts for the window it arrived in only, not until the next one
+            http_latency, self.http_latency = self.http_latency, None
+            self.sent = self.errors = 0
+
+        loss = 0.0
+        if self.simulator is not None:
+            received, dropped = self.simulator.stats()
+            d_received = received - self._sim_mark[0]
+            d_dropped = dropped - self._sim_mark[1]
+            self._sim_mark = (received, dropped)
+            if d_received:
+                loss = d_dropped / d_received
+
+        congested = (
+            (sent and errors / sent > 0.01) or
+            loss > 0.05 or
+            (http_latency is not None and http_latency > self.http_slow)
+        )
+        if congested:
+            self.fps = max(self.min_fps, self.fps * 0.75)
+        elif sent / elapsed > 0.9 * self.fps:
+            # Only add headroom the loop actually uses: a loop held back by the camera
+            # (or idling) would otherwise push fps up and the transition down for nothing
+            self.fps = min(self.max_fps, self.fps + 1)
+        self.last_loss = loss
+
+    def status(self):
+        return f"{self.fps:5.1f} fps, transition {self.transition}, loss {self.last_loss:.0%}"
+
+
+class LinkSimulator:
+    """
+    Local stand-in for the Nanoleaf UDP endpoint with a lossy, rate-limited link.
+
+    Packets beyond `capacity` per second are dropped (like an overrun controller on
+    busy Wi-Fi), on top of a random `loss` ratio. stats() reports what was dropped.
+    """
+
+    def __init__(self, capacity=20, loss=0.0, host="127.0.0.1", port=0):
+        self.capacity = capacity
+        self.loss = loss
+        self.received = 0
+        self.dropped = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.settimeout(0.1)
+        self.address = self.sock.getsockname()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.sock.close()
+
+    def stats(self):
+        with self._lock:
+            return self.received, self.dropped
+
+    def _serve(self):
+        # Token bucket refilled at `capacity` packets per second
+        tokens = self.capacity
+        last = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.sock.recvfrom(65535)
+            except socket.timeout:
+                continue
+            now = time.monotonic()
+            tokens = min(self.capacity, tokens + (now - last) * self.capacity)
+            last = now
+            dropped = tokens < 1 or random.random() < self.loss
+            if not dropped:
+                tokens -= 1
+            with self._lock:
+                self.received += 1
+                self.dropped += dropped
+
+
+if __name__ == "__main__":
+    # Drive a controller against a simulated link whose capacity drops mid-run
+    sim = LinkSimulator(capacity=45, loss=0.005).start()
+    link = LinkController(fps=30, transition=2)
+    link.attach_simulator(sim)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    payload = bytes(2 + 8 * 20)
+
+    start = time.monotonic()
+    next_report = start
+    try:
+        while time.monotonic() - start < 20:
+            elapsed = time.monotonic() - start
+            sim.capacity = 45 if elapsed < 7 or elapsed > 14 else 12  # busy Wi-Fi in the middle
+            link.send(sock, payload, sim.address)
+            if time.monotonic() >= next_report:
+                print(f"t={elapsed:4.1f}s capacity={sim.capacity:2d}/s  {link.status()}")
+                next_report += 1
+            link.pace()
+    finally:
+        sim.stop()
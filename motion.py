@@ -0,0 +1,153 @@
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# Per-panel change detection on a decimated copy of the frame, so a still room skips
+# resampling and only resends every `keepalive`.
+
+
+class MotionGate:
+    def __init__(self, panel_map, viewport_size, decimate=8, threshold=10, min_changed=0.05,
+                 keepalive=1.0, idle_fps=8):
+        """
+        Parameters:
+            panel_map (list): Mapped panels from map_layout_no_overlap().
+            viewport_size (tuple): (width, height) of the sampled frames.
+            decimate (int): Downscale factor of the frame used for change detection.
+            threshold (int): Difference on any of B, G, R above which a decimated pixel changed.
+            min_changed (float): Fraction of a panel's pixels that must change to resample it.
+            keepalive (float): Seconds between sends while nothing changes.
+            idle_fps (float): Frame rate to poll the camera at while nothing changes.
+        """
+        w, h = viewport_size
+        self.small_size = (max(1, w // decimate), max(1, h // decimate))
+        self.threshold = threshold
+        self.min_changed = min_changed
+        self.keepalive = keepalive
+        self.idle_interval = 1 / idle_fps
+        self.idle = False
+
+        sw, sh = self.small_size
+        boxes = np.array([p['bbox'] for p in panel_map], np.int64)
+        # Integral image coordinates, clipped and at least one decimated pixel wide
+        x1 = np.clip(boxes[:, 0] // decimate, 0, sw - 1)
+        y1 = np.clip(boxes[:, 1] // decimate, 0, sh - 1)
+        x2 = np.clip(-(-boxes[:, 2] // decimate), x1 + 1, sw)
+        y2 = np.clip(-(-boxes[:, 3] // decimate), y1 + 1, sh)
+        self._boxes = np.stack([x1, y1, x2, y2], axis=1)
+        self._areas = ((x2 - x1) * (y2 - y1)).astype(np.float64)
+        self._all = np.arange(len(panel_map))
+
+        self._ref = None
+        self._last_send = 0.0
+
+    def _decimate(self, frame):
+        return cv2.resize(frame, self.small_size, interpolation=cv2.INTER_AREA)
+
+    def update(self, frame):
+        """Return the indices (into panel_map) of the panels whose region changed."""
+        small = self._decimate(frame)
+        if self._ref is None:
+            self._ref = small
+            self.idle = False
+            return self._all
+
+        # Colour, not just brightness: a panel can change hue at the same grey level
+        diff = cv2.absdiff(small, self._ref).max(axis=2)
+        if diff.max() <= self.threshold:
+            self.idle = True
+            return self._all[:0]
+
+        # Changed pixels per panel: an object covering part of a large panel still
+        # counts once it covers `min_changed` of it, however long it stays put
+        ii = cv2.integral((diff > self.threshold).astype(np.uint8))
+        x1, y1, x2, y2 = self._boxes.T
+        counts = ii[y2, x2] - ii[y1, x2] - ii[y2, x1] + ii[y1, x1]
+        changed = np.flatnonzero(counts / self._areas >= self.min_changed)
+
+        # References only move for panels that changed, so slow drifts (daylight)
+        # still add up to a resample instead of being absorbed frame by frame
+        for i in changed:
+            bx1, by1, bx2, by2 = self._boxes[i]
+            self._ref[by1:by2, bx1:bx2] = small[by1:by2, bx1:bx2]
+        self.idle = changed.size == 0
+        return changed
+
+    def should_send(self, changed, now=None):
+        """Send when panels changed, or when the keep-alive is due on a static scene."""
+        now = time.monotonic() if now is None else now
+        if len(changed) or now - self._last_send >= self.keepalive:
+            self._last_send = now
+            return True
+        return False
+
+
+def _synthetic_clip(kind, n_frames=300, size=(640, 480), seed=0):
+    """A still room with sensor noise, optionally with a hand-sized blob moving across."""
+    rng = np.random.default_rng(seed)
+    w, h = size
+    base = cv2.GaussianBlur(rng.integers(0, 255, (h, w, 3), dtype=np.uint8), (0, 0), 25)
+    for i in range(n_frames):
+        noise = rng.integers(-2, 3, (h, w, 3), dtype=np.int16)
+        frame = np.clip(base.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        if kind == "dynamic":
+            x = int((i * 7) % w)
+            cv2.circle(frame, (x, h // 2), 60, (90, 140, 210), -1)
+        yield frame
+
+
+def _video_clip(path, size=(640, 480)):
+    cap = cv2.VideoCapture(path)
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        yield cv2.resize(frame, size)
+    cap.release()
+
+
+def _benchmark(name, frames, panel_map, size):
+    frames = list(frames)
+    boxes = [p['bbox'] for p in panel_map]
+
+    t0 = time.process_time()
+    for frame in frames:
+        for x1, y1, x2, y2 in boxes:
+            frame[y1:y2, x1:x2].mean(axis=(0, 1))
+    full = time.process_time() - t0
+
+    gate = MotionGate(panel_map, size)
+    sampled = sends = idle = 0
+    t0 = time.process_time()
+    for i, frame in enumerate(frames):
+        changed = gate.update(frame)
+        for j in changed:
+            x1, y1, x2, y2 = boxes[j]
+            frame[y1:y2, x1:x2].mean(axis=(0, 1))
+        sampled += len(changed)
+        sends += gate.should_send(changed, now=i / 30)  # clip time at 30 FPS
+        idle += gate.idle
+    gated = time.process_time() - t0
+
+    n = len(frames)
+    print(f"{name:>10}: {n} frames | sample all {full / n * 1000:6.3f} ms/frame | "
+          f"gated {gated / n * 1000:6.3f} ms/frame | panels resampled "
+          f"{sampled / (n * len(boxes)):5.1%} | sends {sends / n:5.1%} | idle frames {idle / n:5.1%}")
+
+
+if __name__ == "__main__":
+    # python motion.py [static_clip dynamic_clip]: per-frame CPU time of sampling every
+    # panel versus the gated pipeline, on recorded clips or on synthetic ones
+    from utils import demo_panel_map
+
+    size = (640, 480)
+    panel_map = demo_panel_map(size)
+
+    if len(sys.argv) == 3:
+        clips = {"static": _video_clip(sys.argv[1], size), "dynamic": _video_clip(sys.argv[2], size)}
+    else:
+        clips = {kind: _synthetic_clip(kind, size=size) for kind in ("static", "dynamic")}
+    for name, frames in clips.items():
+        _benchmark(name, frames, panel_map, size)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Single entry point for all the Nanoleaf experiments.
+
+    nanoleaf-exp.py --list
+    nanoleaf-exp.py [--timings] <effect> [effect args...]
+
+Heavy modules (cv2, numpy, scipy, ...) are only imported once an effect is picked,
+so `--list` returns straight away.
+"""
+import time
+
+_t_start = time.perf_counter()
+
+import argparse  # noqa: E402
+import importlib  # noqa: E402
+import sys  # noqa: E402
+
+from effects import COMMON_REQUIRES, EFFECTS, load_effect  # noqa: E402
+
+
+def timed_import(name):
+    t0 = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return None
+    return time.perf_counter() - t0
+
+
+def print_effects():
+    width = max(len(name) for name in EFFECTS)
+    for effect in EFFECTS.values():
+        print(f"{effect.name:<{width}}  {effect.description}")
+
+
+def load_effect_with_timings(name):
+    """
+    Import the effect one dependency at a time and print where startup time goes.
+    Returns None, after the breakdown, when a required dependency is missing.
+    """
+    effect = EFFECTS[name]
+    rows = [("cli + registry", time.perf_counter() - _t_start)]
+    missing = []
+
+    for module in ("utils",) + COMMON_REQUIRES + effect.requires:
+        elapsed = timed_import(module)
+        rows.append((f"import {module}", "not installed" if elapsed is None else elapsed))
+        if elapsed is None:
+            missing.append(module)
+    for module in effect.optional:
+        elapsed = timed_import(module)
+        rows.append((f"import {module}", "not installed (optional)" if elapsed is None else elapsed))
+
+    module = None
+    if missing:
+        error = f"missing {', '.join(missing)}"
+        rows.append((f"import {effect.module}", "skipped"))
+    else:
+        t0 = time.perf_counter()
+        try:
+            module = load_effect(name)
+        except ImportError as e:
+            error = e
+            rows.append((f"import {effect.module}", "failed"))
+        else:
+            error = None
+            rows.append((f"import {effect.module}", time.perf_counter() - t0))
+    rows.append(("total startup", time.perf_counter() - _t_start))
+
+    print(f"⏱️ Startup timings for '{name}':")
+    for label, elapsed in rows:
+        shown = elapsed if isinstance(elapsed, str) else f"{elapsed * 1000:8.1f} ms"
+        print(f"  {label:<34} {shown}")
+    if error is not None:
+        print(f"❌ Cannot run '{name}': {error}")
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="nanoleaf-exp", description="Run a Nanoleaf effect.")
+    parser.add_argument("--list", action="store_true", help="list the available effects and exit")
+    parser.add_argument("--timings", action="store_true", help="print an import/startup time breakdown")
+    parser.add_argument("effect", nargs="?", choices=sorted(EFFECTS), metavar="effect",
+                        help="one of: " + ", ".join(sorted(EFFECTS)))
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments passed to the effect")
+    args = parser.parse_args()
+
+    if args.list:
+        print_effects()
+        return 0
+    if args.effect is None:
+        parser.error("an effect name is required (see --list)")
+
+    if args.timings:
+        module = load_effect_with_timings(args.effect)
+        if module is None:
+            return 1
+    else:
+        module = load_effect(args.effect)
+    return module.main(args.args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
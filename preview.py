@@ -0,0 +1,198 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+import numpy as np
+
+# Debug preview rendered off the LED loop at its own rate, from an overlay rasterised
+# once, shown in a window (via poll() on the main thread) or streamed as MJPEG.
+
+
+class Preview:
+    MODES = ("window", "mjpeg", "off")
+
+    def __init__(self, panel_map, viewport_size, title="Preview", mode="window", fps=10,
+                 port=8080, scale=0.5, font_scale=0.35):
+        """
+        Parameters:
+            panel_map (list): Mapped panels from map_layout_no_overlap().
+            viewport_size (tuple): (width, height) of the frames the LED loop samples.
+            title (str): Window title in "window" mode.
+            mode (str): "window", "mjpeg" (http://127.0.0.1:<port>/) or "off".
+            fps (float): Preview refresh rate, independent of the LED loop.
+            port (int): Local port of the MJPEG server.
+            scale (float): Downscale factor of the MJPEG stream.
+            font_scale (float): Size of the panel id labels.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown preview mode {mode!r}, expected one of {self.MODES}")
+        self.panel_ids = [p['panelId'] for p in panel_map]
+        self.viewport_size = viewport_size
+        self.title = title
+        self.mode = mode
+        self.fps = fps
+        self.port = port
+        self.scale = scale
+
+        self._build_overlay(panel_map, font_scale)
+        self._latest = None        # (seq, frame, rgbs, active) submitted by the LED loop
+        self._submitted = 0
+        self._ready = None         # rendered frame waiting for poll() in window mode
+        self._jpeg = None
+        self._jpeg_seq = 0
+        self._clients = 0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+
+    @classmethod
+    def from_env(cls, panel_map, viewport_size, **kwargs):
+        """Preview configured by PREVIEW, PREVIEW_FPS and PREVIEW_PORT in .env."""
+        return cls(panel_map, viewport_size, mode=os.getenv("PREVIEW") or "window",
+                   fps=float(os.getenv("PREVIEW_FPS") or 10), port=int(os.getenv("PREVIEW_PORT") or 8080),
+                   **kwargs)
+
+    def _build_overlay(self, panel_map, font_scale):
+        w, h = self.viewport_size
+        overlay = np.full((h, w), -1, np.int32)  # colour index per pixel, -1 = frame
+        labels = np.zeros((h, w), np.uint8)
+        self._dots = []
+        for i, p in enumerate(panel_map):
+            x1, y1, x2, y2 = p['bbox']
+            # The preview is mirrored, so mirror the boxes rather than the drawn text
+            mx1, mx2 = w - 1 - x2, w - 1 - x1
+            layer = np.zeros((h, w), np.uint8)
+            cv2.rectangle(layer, (mx1, y1), (mx2, y2), 1, 2)
+            overlay[layer > 0] = i
+            cv2.putText(labels, str(p['panelId']), (mx1, y1 + 10), cv2.FONT_HERSHEY_SIMPLEX, font_scale, 255, 1)
+            self._dots.append((mx1 + 5, y1 + 20))
+
+        # One byte-level scatter paints outlines (panel colour) and labels (white, the
+        # extra colour after the panels): indices into the flattened BGR frame and into
+        # the flattened colour table, 3 channels per pixel
+        overlay[labels > 0] = len(panel_map)
+        pix = np.flatnonzero(overlay >= 0)
+        channels = np.arange(3)
+        self._overlay_idx = (pix[:, None] * 3 + channels).ravel()
+        self._color_idx = (overlay.ravel()[pix][:, None] * 3 + channels).ravel()
+        self._colors = np.full((len(panel_map) + 1, 3), 255, np.uint8)
+
+    def start(self):
+        if self.mode == "off":
+            return self
+        if self.mode == "mjpeg":
+            self._server = ThreadingHTTPServer(("127.0.0.1", self.port), _MJPEGHandler)
+            self._server.daemon_threads = True
+            self._server.preview = self
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            print(f"📺 Preview stream on http://127.0.0.1:{self.port}/")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        if self.mode == "window":
+            cv2.destroyAllWindows()
+
+    def submit(self, frame, rgbs, active=()):
+        """Hand over the latest frame and panel colours; cheap enough for every LED frame."""
+        if self.mode == "off":
+            return
+        self._submitted += 1
+        self._latest = (self._submitted, frame, rgbs, active)
+
+    def poll(self):
+        """
+        Show the latest rendered preview (window mode only) and return the key pressed,
+        or -1. Call it from the main thread every loop: it costs nothing between previews.
+        """
+        image, self._ready = self._ready, None
+        if image is None:
+            return -1
+        cv2.imshow(self.title, image)
+        return cv2.waitKey(1)
+
+    def render(self, frame, rgbs, active=()):
+        """Composite the precomputed overlay onto a mirrored copy of the frame."""
+        w, h = self.viewport_size
+        if frame.shape[:2] != (h, w):
+            frame = cv2.resize(frame, (w, h))
+        out = cv2.flip(frame, 1)  # mirrored preview, doubles as the copy
+        self._colors[:-1] = [rgbs[pid][::-1] for pid in self.panel_ids]  # RGB to BGR
+        out.reshape(-1)[self._overlay_idx] = self._colors.ravel()[self._color_idx]
+        for i, pid in enumerate(self.panel_ids):
+            if pid in active:
+                cv2.circle(out, self._dots[i], 5, (0, 255, 255), -1)  # yellow dot
+        return out
+
+    def _run(self):
+        period = 1 / self.fps
+        rendered = 0
+        next_t = time.monotonic()
+        while not self._stop.is_set():
+            next_t += period
+            latest = self._latest
+            wanted = self.mode == "window" or self._clients > 0
+            if latest is not None and latest[0] != rendered and wanted:
+                rendered, frame, rgbs, active = latest
+                image = self.render(frame, rgbs, active)
+                if self.mode == "window":
+                    self._ready = image
+                else:
+                    self._publish(image)
+            self._stop.wait(max(0.0, next_t - time.monotonic()))
+
+    def _publish(self, image):
+        small = cv2.resize(image, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        ok, jpeg = cv2.imencode(".jpg", small, [cv2.IMWRITE_JPEG_QUALITY, 70])
+        if ok:
+            with self._cond:
+                self._jpeg = jpeg.tobytes()
+                self._jpeg_seq += 1
+                self._cond.notify_all()
+
+    def wait_jpeg(self, seen_seq, timeout=1.0):
+        with self._cond:
+            self._cond.wait_for(lambda: self._jpeg_seq != seen_seq or self._stop.is_set(), timeout)
+            return self._jpeg, self._jpeg_seq
+
+
+class _MJPEGHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        preview = self.server.preview
+        self.send_response(200)
+        self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        with preview._cond:
+            preview._clients += 1
+        seq = 0
+        try:
+            while not preview._stop.is_set():
+                jpeg, new_seq = preview.wait_jpeg(seq)
+                if jpeg is None or new_seq == seq:
+                    continue
+                seq = new_seq
+                self.wfile.write(b"--frame\r\nContent-Type: image/jpeg\r\n")
+                self.wfile.write(b"Content-Length: %d\r\n\r\n" % len(jpeg))
+                self.wfile.write(jpeg + b"\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with preview._cond:
+                preview._clients -= 1
+
+    def log_message(self, format, *args):
+        pass  # keep the console for the effect's own output
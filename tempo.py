@@ -0,0 +1,294 @@
+import math
+import statistics
+import threading
+import time
+from collections import deque
+
+# Beat clock from MIDI clock or tap tempo (PLL-filtered) and a scheduler that renders
+# frames just ahead of their slot on the beat grid and emits them on time.
+
+PPQN = 24  # MIDI clock ticks per quarter note
+
+
+class TempoTracker:
+    def __init__(self, bpm=120.0, kp=0.1, ki=0.01, clock=time.perf_counter):
+        """
+        Parameters:
+            bpm (float): Tempo to free-run at until a clock or taps come in.
+            kp (float): PLL phase gain, fraction of a tick's timing error corrected.
+            ki (float): PLL frequency gain, fraction of the error fed into the period.
+            clock (callable): Monotonic time source shared with the scheduler.
+        """
+        self.kp = kp
+        self.ki = ki
+        self.clock = clock
+        self.running = True     # False between a MIDI stop and the next start/continue
+        self.generation = 0     # bumped whenever the beat count is reset (MIDI start)
+        self._taps = deque(maxlen=5)
+        # (time of the reference tick, its index, tick period) swapped as one tuple so
+        # readers in other threads always see a consistent snapshot
+        self._ref = (clock(), 0, 60.0 / (bpm * PPQN))
+        self._locked = False
+        self._last_tick = float("-inf")
+        self._outliers = 0
+
+    @property
+    def bpm(self):
+        return 60.0 / (self._ref[2] * PPQN)
+
+    @property
+    def beat_period(self):
+        return self._ref[2] * PPQN
+
+    def on_message(self, msg, t=None):
+        """Feed a mido message; clock/start/continue/stop drive the tracker, others are ignored."""
+        t = self.clock() if t is None else t
+        if msg.type == 'clock':
+            self._on_tick(t)
+        elif msg.type == 'start':
+            # The first clock after start is beat 0
+            period = self._ref[2]
+            self._ref = (t - period, -1, period)
+            self.generation += 1
+            self.running = True
+        elif msg.type == 'continue':
+            self.running = True
+        elif msg.type == 'stop':
+            # Keep free-running at the last tempo so `continue` picks up in phase
+            self.running = False
+
+    def _on_tick(self, t):
+        tick_time, ticks, period = self._ref
+        gap, self._last_tick = t - self._last_tick, t
+        if not self._locked:
+            if ticks >= 0 and 0 < gap < 4 * period:
+                period = gap
+                self._locked = True
+            self._ref = (t, ticks + 1, period)
+            return
+
+        error = t - (tick_time + period)
+        if abs(error) > period / 4:
+            self._outliers += 1
+            if gap > 1.75 * period:
+                # Dropout: count the ticks that never arrived, keep the tempo
+                self._ref = (t, ticks + round(gap / period), period)
+                self._outliers = 0
+            elif self._outliers >= 2:
+                # Two off ticks in a row is a tempo change, not jitter: restart from it
+                self._ref = (t, ticks + 1, gap)
+                self._outliers = 0
+            else:
+                # A one-off late/early tick: trust the prediction over it
+                self._ref = (tick_time + period, ticks + 1, period)
+            return
+
+        self._outliers = 0
+        period += self.ki * error
+        self._ref = (tick_time + period + self.kp * error, ticks + 1, period)
+
+    def tap(self, t=None):
+        """Tap tempo: every call is a beat; a pause over 2 s starts a new tap sequence."""
+        t = self.clock() if t is None else t
+        if self._taps and t - self._taps[-1] > 2.0:
+            self._taps.clear()
+        self._taps.append(t)
+        period = self._ref[2]
+        if len(self._taps) >= 2:
+            intervals = [b - a for a, b in zip(self._taps, list(self._taps)[1:])]
+            period = statistics.median(intervals) / PPQN
+        # The tap is on the beat: snap the nearest beat onto it
+        beat = round(self.position(t))
+        self._ref = (t, beat * PPQN, period)
+
+    def position(self, t=None):
+        """Beats elapsed at time t (default now)."""
+        t = self.clock() if t is None else t
+        tick_time, ticks, period = self._ref
+        return (ticks + (t - tick_time) / period) / PPQN
+
+    def time_at(self, beat):
+        """Predicted time of a beat position."""
+        tick_time, ticks, period = self._ref
+        return tick_time + (beat * PPQN - ticks) * period
+
+
+class BeatScheduler:
+    def __init__(self, tracker, render, emit, fps=30, lookahead=0.005, spin=0.0015, max_sleep=0.02):
+        """
+        Parameters:
+            tracker (TempoTracker): Beat clock the frames are aligned to.
+            render (callable): render(beat) -> frame, called `lookahead` s before the deadline.
+            emit (callable): emit(frame), called as close to the deadline as possible.
+            fps (float or callable): Target frame rate, rounded to whole frames per beat
+                so that a frame always lands on the beat. A callable is read every beat.
+            lookahead (float): Seconds to pre-render ahead of the deadline.
+            spin (float): Seconds before the deadline to stop sleeping and busy-wait.
+            max_sleep (float): Longest single sleep, so tempo changes and a MIDI
+                start/stop are noticed while waiting.
+        """
+        self.tracker = tracker
+        self.render = render
+        self.emit = emit
+        self.fps = fps
+        self.lookahead = lookahead
+        self.spin = spin
+        self.max_sleep = max_sleep
+        self.beat_jitter = deque(maxlen=512)  # emit time - deadline of on-beat frames
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _frames_per_beat(self):
+        fps = self.fps() if callable(self.fps) else self.fps
+        return max(1, round(fps * self.tracker.beat_period))
+
+    def _wait_until(self, pos, offset=0.0, generation=None):
+        """
+        Wait until `offset` s before the predicted time of beat position `pos`, following
+        tempo updates while sleeping. Returns the deadline reached, or None if the wait
+        was cut short by stop(), a MIDI stop or a reset of the beat count.
+        """
+        tracker = self.tracker
+        clock = tracker.clock
+        while True:
+            if self._stop.is_set() or not tracker.running or tracker.generation != generation:
+                return None
+            deadline = tracker.time_at(pos) - offset
+            remaining = deadline - clock()
+            if remaining <= self.spin:
+                break
+            self._stop.wait(min(remaining - self.spin, self.max_sleep))
+        while clock() < deadline:
+            time.sleep(0)  # spin, but let the MIDI thread have the GIL
+        return deadline
+
+    def run(self):
+        tracker = self.tracker
+        clock = tracker.clock
+        generation = None
+        while not self._stop.is_set():
+            if not tracker.running:
+                # MIDI stop: hold the panels on the last frame
+                self._stop.wait(self.max_sleep)
+                generation = None  # re-sync when the clock comes back
+                continue
+            if generation != tracker.generation:
+                # (Re)start on the next frame slot of the current beat count
+                generation = tracker.generation
+                position = tracker.position()
+                beat = math.floor(position)
+                fpb = self._frames_per_beat()
+                frame = math.ceil((position - beat) * fpb)
+
+            pos = beat + frame / fpb
+            if tracker.time_at(pos) < clock():
+                # Late (tempo jumped or we were descheduled): skip to the next frame slot
+                frame += 1
+            elif self._wait_until(pos, self.lookahead, generation) is not None:
+                rendered = self.render(pos)
+                # The tempo estimate may have moved while rendering, aim at the latest one
+                deadline = self._wait_until(pos, 0.0, generation)
+                if deadline is None:
+                    continue
+                self.emit(rendered)
+                if frame == 0:
+                    self.beat_jitter.append(clock() - deadline)
+                frame += 1
+            if frame >= fpb:
+                beat += frame // fpb
+                frame = 0
+                fpb = self._frames_per_beat()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def jitter_stats(self):
+        """(mean, p99, max) absolute on-beat emit error in milliseconds."""
+        errors = sorted(abs(e) * 1000 for e in self.beat_jitter)
+        if not errors:
+            return 0.0, 0.0, 0.0
+        p99 = errors[math.ceil(0.99 * len(errors)) - 1]  # nearest rank
+        return statistics.mean(errors), p99, errors[-1]
+
+
+class VirtualMidiClock:
+    """
+    MIDI clock source for testing: sends start then clock messages at `bpm` to
+    `callback(msg)` from a thread, each delivered with up to `jitter` s of random delay
+    like a USB MIDI interface would. beat_time(n) gives the true time of beat n.
+    """
+
+    def __init__(self, callback, bpm=120.0, jitter=0.001, clock=time.perf_counter):
+        import mido
+
+        self._mido = mido
+        self.callback = callback
+        self.bpm = bpm
+        self.jitter = jitter
+        self.clock = clock
+        self._beats = []  # true beat times
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def beat_times(self):
+        return list(self._beats)
+
+    def _run(self):
+        import random
+
+        clock_msg = self._mido.Message('clock')
+        next_tick = self.clock() + 0.05
+        self._deliver(self._mido.Message('start'), next_tick - 0.001)
+        tick = 0
+        while not self._stop.is_set():
+            if tick % PPQN == 0:
+                self._beats.append(next_tick)
+            self._deliver(clock_msg, next_tick + random.uniform(0, self.jitter))
+            next_tick += 60.0 / (self.bpm * PPQN)
+            tick += 1
+
+    def _deliver(self, msg, at):
+        while self.clock() < at:
+            time.sleep(0.001 if at - self.clock() > 0.002 else 0)
+        self.callback(msg)
+
+
+if __name__ == "__main__":
+    # Follow a jittery virtual MIDI clock that changes tempo, and measure how far the
+    # scheduler's on-beat frames land from the clock's true beats once it has settled
+    tracker = TempoTracker(bpm=100)
+    emitted = []
+    scheduler = BeatScheduler(tracker, render=lambda beat: beat, emit=lambda beat: emitted.append(
+        (beat, tracker.clock())), fps=30)
+    source = VirtualMidiClock(tracker.on_message, bpm=120, jitter=0.002).start()
+    time.sleep(2)  # let the PLL lock
+    scheduler.start()
+    for bpm in (120, 128, 90):
+        source.bpm = bpm
+        time.sleep(4)  # settle on the new tempo, then measure a fresh window
+        scheduler.beat_jitter.clear()
+        mark = len(emitted)
+        time.sleep(6)
+        beats = source.beat_times()
+        window = [t for beat, t in emitted[mark:] if beat == int(beat)]
+        errors = sorted(min(abs(t - b) for b in beats[-40:]) * 1000 for t in window)
+        print(f"{bpm:5.1f} BPM: estimated {tracker.bpm:6.2f} BPM | on-beat error vs clock over "
+              f"{len(errors)} beats mean {statistics.mean(errors):5.2f} ms, max {errors[-1]:5.2f} ms | "
+              f"emit vs deadline mean/p99/max {'/'.join(f'{v:.2f}' for v in scheduler.jitter_stats())} ms")
+    scheduler.stop()
+    source.stop()
@@ -2,13 +2,19 @@ import os
 import time
 from pathlib import Path
 
-from dotenv import load_dotenv
-from nanoleafapi import Nanoleaf
-from zeroconf import ServiceBrowser, Zeroconf
+# Heavy third-party modules (dotenv, nanoleafapi, zeroconf) are imported inside
+# the functions that need them, so importing utils stays cheap for every effect
 
-# Automatically load .env from the same folder as this utils.py file
-dotenv_path = Path(__file__).resolve().parent / '.env'
-load_dotenv(dotenv_path)
+_env_loaded = False
+
+
+def load_env():
+    """Load .env from the same folder as this utils.py file (only once)."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv(Path(__file__).resolve().parent / '.env')
+        _env_loaded = True
 
 
 class NanoleafListener:
@@ -28,6 +34,9 @@ class NanoleafListener:
 
 
 def get_nanoleaf_credentials():
+    from zeroconf import ServiceBrowser, Zeroconf
+
+    load_env()
     zeroconf = Zeroconf()
     listener = NanoleafListener()
     browser = ServiceBrowser(zeroconf, "_nanoleafapi._tcp.local.", listener)
@@ -49,6 +58,8 @@ def get_nanoleaf_credentials():
 
 
 def get_nanoleaf_object():
+    from nanoleafapi import Nanoleaf
+
     ip, token = get_nanoleaf_credentials()
     nl = Nanoleaf(ip, token)
     # clear any existing color
@@ -137,3 +148,10 @@ def map_layout_no_overlap(panels, viewport_size=(320, 240), gap_px=0, stretch=Tr
         })
 
     return mapped_panels
+
+
+def demo_panel_map(viewport_size=(640, 480)):
+    """Panel map of a made-up 15 panel layout (every 4th a square), for benchmarks without panels."""
+    panels = [{'panelId': i, 'shapeType': 33 if i % 4 == 0 else 34, 'x': (i % 5) * 140, 'y': (i // 5) * 140}
+              for i in range(15)]
+    return map_layout_no_overlap(panels, viewport_size=viewport_size, stretch=False)